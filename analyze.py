@@ -2,122 +2,655 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import math
+import os
+import pickle
 import sys
-from typing import Optional, Any
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Any, Callable
 import datetime  # 날짜 처리를 위해 추가
 
-import pandas as pd
-import pandas_ta as ta
-import yfinance as yf
-from pykrx import stock  # [!!! 신규 라이브러리 임포트 !!!]
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 # 보조 지표 컬럼 이름을 상수로 정의
 RSI_COLUMN = "RSI_14"
 SMA20_COLUMN = "SMA_20"
 SMA50_COLUMN = "SMA_50"
 MACD_COLUMN = "MACD_12_26_9"
+MACD_HIST_COLUMN = "MACDh_12_26_9"
 MACD_SIGNAL_COLUMN = "MACDs_12_26_9"
 
+# 네트워크 응답을 하루 단위로 재사용하기 위한 디스크 캐시 위치
+CACHE_DIR = Path.home() / ".cache" / "analyze"
+# 첫 봉이 고정되어 새 봉만 뒤에 붙는 기간: 이 기간에서만 지표 상태를 저장해 이어서 계산
+STATEFUL_PERIODS = frozenset({"max", "ytd"})
+# 이보다 오래된 캐시 파일은 실행할 때 지움 (지표 상태 파일은 제외)
+CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
 
-def download_stock_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
+
+@functools.lru_cache(maxsize=None)
+def _pandas() -> Any:
+    """Import pandas on first use instead of at module load.
+
+    Copy-on-Write를 켜서 방어적 복사 없이도 호출자의 DataFrame이 변경되지 않음을 보장
+    (pandas 3.0부터는 항상 켜져 있으며 옵션 설정은 경고만 발생시킴).
+    """
+    import pandas as pd
+
+    if int(pd.__version__.split(".", 1)[0]) < 3:
+        pd.options.mode.copy_on_write = True
+    return pd
+
+
+def _cache_key(*parts: str) -> str:
+    """Build a stable cache file name from the given key parts.
+
+    첫 번째 부분(데이터 종류)을 파일 이름 앞에 붙여 정리할 때 종류를 구분합니다.
+    """
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    return f"{parts[0]}-{digest}"
+
+
+def _prune_disk_cache() -> None:
+    """Delete cache files older than ``CACHE_MAX_AGE_SECONDS``.
+
+    가격/기본적 분석/KRX 표 캐시는 날짜가 키에 들어가 다음 날에는 다시 읽히지 않으므로
+    지우고, 실행마다 이어서 갱신되는 지표 상태(``state-``) 파일만 남깁니다.
+    """
+    cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith("state-"):
+            continue
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _is_intraday(interval: str) -> bool:
+    """Return whether ``interval`` is an intraday bar size such as ``1m`` or ``1h``.
+
+    장중 봉은 하루 동안 계속 추가되므로 하루 단위 캐시를 쓰지 않습니다.
+    (``1mo``처럼 ``mo``로 끝나는 월 간격은 장중 간격이 아님)
+    """
+    return interval.endswith(("m", "h"))
+
+
+def _cached_on_disk(
+    key: str,
+    fetch: Callable[[], Any],
+    *,
+    store_empty: bool = True,
+    refresh: bool = False,
+) -> Any:
+    """Return the pickled value stored under ``key`` or fetch and store it.
+
+    캐시 읽기/쓰기 실패는 치명적이지 않으므로 조용히 네트워크 호출로 대체합니다.
+    ``refresh``가 참이면 저장된 값을 무시하고 새로 받아 캐시를 덮어씁니다.
+    """
+    if not refresh:
+        cached = _load_from_disk(key)
+        if cached is not None:
+            return cached
+
+    value = fetch()
+    if not store_empty:
+        is_empty = value.empty if hasattr(value, "empty") else not value
+        if is_empty:
+            return value
+
+    _store_on_disk(key, value)
+    return value
+
+
+def _load_from_disk(key: str) -> Any:
+    """Return the value pickled under ``key``, or ``None`` if it cannot be read."""
+    path = CACHE_DIR / f"{key}.pkl"
+    try:
+        with path.open("rb") as handle:
+            return pickle.load(handle)
+    except Exception:
+        return None
+
+
+def _store_on_disk(key: str, value: Any) -> None:
+    """Pickle ``value`` under ``key``; write failures are ignored."""
+    path = CACHE_DIR / f"{key}.pkl"
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 여러 스레드가 같은 키를 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 고유한 이름 사용
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=f"{key}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except Exception:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def download_stock_data(
+    ticker: str, period: str, interval: str, *, use_cache: bool = True
+) -> pd.DataFrame:
+    """Download historical stock data for the given ticker (cached per day, except intraday)."""
+    _pandas()  # 반환 전에 Copy-on-Write 설정이 적용되도록 보장
+    if _is_intraday(interval):
+        return _fetch_stock_data(ticker, period, interval)
+    today = datetime.date.today().isoformat()
+    # 메모이즈된 원본은 Copy-on-Write가 보호하므로 얕은 복사면 충분함
+    # (copy()의 기본값 deep=True는 CoW에서도 즉시 전체를 복사함)
+    data = _download_stock_data_cached(ticker, period, interval, today, not use_cache)
+    return data.copy(deep=False)
+
+
+@functools.lru_cache(maxsize=32)
+def _download_stock_data_cached(
+    ticker: str, period: str, interval: str, day: str, refresh: bool
+) -> pd.DataFrame:
+    """Memoized (in-process and on disk) wrapper around :func:`_fetch_stock_data`."""
+    key = _cache_key("history", ticker, period, interval, day)
+    return _cached_on_disk(
+        key, lambda: _fetch_stock_data(ticker, period, interval), refresh=refresh
+    )
+
+
+def _fetch_stock_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
     """Download historical stock data for the given ticker. (Using yfinance for all)"""
     # 기술적 분석 데이터는 yfinance가 .KS도 잘 제공하므로 일관성을 위해 유지
+    import yfinance as yf  # 무거운 네트워크 라이브러리는 실제로 필요할 때만 임포트
+
+    # auto_adjust=True이면 'Close'가 이미 수정 종가이므로 'Adj Close'를 따로 받을 필요가 없음
     data = yf.download(
         ticker,
         period=period,
         interval=interval,
         progress=False,
-        auto_adjust=False
+        auto_adjust=True
     )
 
+    return _normalize_stock_data(ticker, data)
+
+
+def download_stock_data_batch(
+    tickers: list[str], period: str, interval: str, *, use_cache: bool = True
+) -> dict[str, pd.DataFrame]:
+    """Download several tickers at once with a single threaded ``yf.download`` call.
+
+    오늘 이미 캐시된 종목은 캐시에서 읽고 나머지만 한 번에 요청합니다(장중 간격은 캐시 안 함).
+    데이터를 받지 못한 종목은 결과에서 빠지며, 호출자가 개별 다운로드로 처리합니다.
+    """
+    today = datetime.date.today().isoformat()
+    use_cache = use_cache and not _is_intraday(interval)
+    frames: dict[str, pd.DataFrame] = {}
+    missing = []
+    for ticker in tickers:
+        key = _cache_key("history", ticker, period, interval, today)
+        if use_cache and (CACHE_DIR / f"{key}.pkl").exists():
+            frames[ticker] = download_stock_data(ticker, period, interval)
+        else:
+            missing.append(ticker)
+
+    if not missing:
+        return frames
+
+    import yfinance as yf
+
+    raw = yf.download(
+        missing,
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+        auto_adjust=True,
+    )
+    for ticker in missing:
+        try:
+            # 여러 종목의 거래일을 합친 인덱스이므로 해당 종목에 값이 없는 행은 제거
+            data = _normalize_stock_data(ticker, raw[ticker].dropna(how="all"))
+        except (KeyError, ValueError):
+            continue
+        if not _is_intraday(interval):
+            _store_on_disk(_cache_key("history", ticker, period, interval, today), data)
+        frames[ticker] = data
+    return frames
+
+
+def _normalize_stock_data(ticker: str, data: pd.DataFrame) -> pd.DataFrame:
+    """Validate a downloaded price frame and lowercase its column names."""
     if data.empty:
         raise ValueError(
             f"'{ticker}'에 대한 데이터를 찾을 수 없습니다. 티커와 기간/간격을 확인해 주세요."
         )
 
-    if isinstance(data.columns, pd.MultiIndex):
-        data.columns = data.columns.droplevel(1)
-
-    data.columns = data.columns.str.lower()
+    # 컬럼 이름은 한 번만 계산해 한 번에 교체한다 (MultiIndex이면 첫 단계 이름 사용)
+    names = [str(name).lower() for name in data.columns.get_level_values(0)]
 
-    if 'adj close' in data.columns:
-        if 'close' in data.columns:
-            data = data.drop(columns=['close'])
-        data.rename(columns={'adj close': 'close'}, inplace=True)
-    elif 'close' not in data.columns:
-        raise ValueError(f"데이터에 'close' 또는 'adj close' 컬럼이 없습니다. 사용 가능한 컬럼: {list(data.columns)}")
+    if 'close' not in names:
+        raise ValueError(f"데이터에 'close' 컬럼이 없습니다. 사용 가능한 컬럼: {names}")
 
+    data.columns = names
     return data
 
 
+def get_fundamental_data(
+    ticker_str: str, latest_trading_day: str, *, use_cache: bool = True
+) -> dict[str, Any]:
+    """Get key fundamental metrics, reusing results fetched earlier today."""
+    today = datetime.date.today().isoformat()
+    return dict(
+        _get_fundamental_data_cached(ticker_str, latest_trading_day, today, not use_cache)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_fundamental_data_cached(
+    ticker_str: str, latest_trading_day: str, day: str, refresh: bool
+) -> dict[str, Any]:
+    """Memoized wrapper around :func:`_fetch_fundamental_data` (1 day TTL).
+
+    실패(빈 딕셔너리)는 디스크에 저장하지 않아 다음 실행에서 다시 시도합니다.
+    """
+    key = _cache_key("fundamentals", ticker_str, latest_trading_day, day)
+    return _cached_on_disk(
+        key,
+        lambda: _fetch_fundamental_data(ticker_str, latest_trading_day, refresh=refresh),
+        store_empty=False,
+        refresh=refresh,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _yf_info(ticker_str: str) -> dict[str, Any]:
+    """Fetch the full ``Ticker.info`` dictionary once per ticker and process.
+
+    ``fast_info``는 가격 관련 값만 제공하고 PER/PBR/ROE는 없으므로,
+    전체 info 조회를 한 번만 수행해 재사용합니다.
+    """
+    import yfinance as yf
+
+    return yf.Ticker(ticker_str).get_info()
+
+
+# 날짜별 KRX 표 조회 잠금 (lru_cache는 동시에 발생한 캐시 미스를 하나로 합치지 않음)
+_KRX_LOCKS: dict[str, threading.Lock] = {}
+_KRX_LOCKS_GUARD = threading.Lock()
+
+
+def _krx_fundamentals(date_str: str, refresh: bool = False) -> pd.DataFrame:
+    """Return the KRX market-wide fundamentals table for ``date_str`` (YYYYMMDD).
+
+    표 전체(수천 종목)를 내려받으므로 날짜별로 메모리와 디스크에 캐시하여
+    같은 날 다른 종목을 조회할 때 재사용합니다. 여러 스레드가 같은 날짜를
+    동시에 요청하면 한 스레드만 내려받고 나머지는 그 결과를 기다립니다.
+    """
+    with _KRX_LOCKS_GUARD:
+        lock = _KRX_LOCKS.setdefault(date_str, threading.Lock())
+    with lock:
+        return _krx_fundamentals_cached(date_str, refresh)
+
+
+@functools.lru_cache(maxsize=8)
+def _krx_fundamentals_cached(date_str: str, refresh: bool) -> pd.DataFrame:
+    """Memoized (in-process and on disk) KRX fundamentals table lookup."""
+    from pykrx import stock  # 한국 주식을 조회할 때만 필요
+
+    return _cached_on_disk(
+        _cache_key("krx_fundamentals", date_str),
+        lambda: stock.get_market_fundamental(date_str),
+        store_empty=False,
+        refresh=refresh,
+    )
+
+
 # [!!! 핵심 수정: get_fundamental_data 함수 전체 변경 !!!]
-def get_fundamental_data(ticker_str: str, latest_trading_day: str) -> dict[str, Any]:
-    """Get key fundamental metrics based on the ticker type."""
+def _fetch_fundamental_data(
+    ticker_str: str, latest_trading_day: str, *, refresh: bool = False
+) -> dict[str, Any]:
+    """Get key fundamental metrics based on the ticker type.
+
+    조회 실패는 예외로 그대로 전달되며, 호출자가 해당 종목의 보고서에 경고를 넣습니다.
+    (실패한 결과는 메모리/디스크 캐시에도 남지 않음)
+    """
     fundamentals = {}
-    try:
-        # 1. 한국 주식(.KS, .KQ)인 경우
-        if ticker_str.endswith((".KS", ".KQ")):
-            kr_ticker = ticker_str.split('.')[0] # '005930.KS' -> '005930'
-            
-            # pykrx는 날짜가 필요함. yfinance에서 받은 최근 거래일을 사용
-            funda_date_str = latest_trading_day.replace("-", "") # '2025-11-10' -> '20251110'
-            
-            # 해당 날짜의 모든 주식 기본 정보를 가져옴
-            df_funda = stock.get_market_fundamental(funda_date_str)
-            
-            # 해당 티커의 정보(행)를 추출
-            info = df_funda.loc[kr_ticker]
-            
-            fundamentals = {
-                'per': info.get('PER'),
-                'pbr': info.get('PBR'),
-            }
-            
-            # ROE = (EPS / BPS) * 100
-            eps = info.get('EPS')
-            bps = info.get('BPS')
-            
-            if pd.notna(eps) and pd.notna(bps) and bps != 0:
-                # pykrx의 ROE는 yfinance와 달리 비율(0.15)이 아니므로, 
-                # (EPS/BPS)로 직접 계산하여 비율(ratio)로 저장
-                fundamentals['roe'] = (eps / bps) 
-            else:
-                fundamentals['roe'] = None
-
-        # 2. 미국 주식 (또는 그 외)인 경우
-        else:
-            stock_yf = yf.Ticker(ticker_str)
-            info = stock_yf.info
-            fundamentals = {
-                'per': info.get('trailingPE'),      # PER (과거 12개월)
-                'pbr': info.get('priceToBook'),      # PBR
-                'roe': info.get('returnOnEquity'),   # ROE (이미 비율로 제공됨)
-            }
+    # 1. 한국 주식(.KS, .KQ)인 경우
+    if ticker_str.endswith((".KS", ".KQ")):
+        kr_ticker = ticker_str.split('.')[0] # '005930.KS' -> '005930'
         
-        return fundamentals
+        # pykrx는 날짜가 필요함. yfinance에서 받은 최근 거래일을 사용
+        funda_date_str = latest_trading_day.replace("-", "") # '2025-11-10' -> '20251110'
         
-    except Exception as e:
-        print(f"\n[경고] 기본적 분석 데이터 가져오기 실패: {e}")
-        return {} # 실패 시 빈 딕셔너리 반환
+        # 해당 날짜의 모든 주식 기본 정보를 가져옴 (날짜별로 한 번만 조회)
+        df_funda = _krx_fundamentals(funda_date_str, refresh)
+        
+        # 해당 티커의 정보(행)를 추출
+        info = df_funda.loc[kr_ticker]
+        
+        fundamentals = {
+            'per': info.get('PER'),
+            'pbr': info.get('PBR'),
+        }
+        
+        # ROE = (EPS / BPS) * 100
+        eps = info.get('EPS')
+        bps = info.get('BPS')
+        
+        pd = _pandas()
+        if pd.notna(eps) and pd.notna(bps) and bps != 0:
+            # pykrx의 ROE는 yfinance와 달리 비율(0.15)이 아니므로, 
+            # (EPS/BPS)로 직접 계산하여 비율(ratio)로 저장
+            fundamentals['roe'] = (eps / bps) 
+        else:
+            fundamentals['roe'] = None
+
+    # 2. 미국 주식 (또는 그 외)인 경우
+    else:
+        info = _yf_info(ticker_str)
+        fundamentals = {
+            'per': info.get('trailingPE'),      # PER (과거 12개월)
+            'pbr': info.get('priceToBook'),      # PBR
+            'roe': info.get('returnOnEquity'),   # ROE (이미 비율로 제공됨)
+        }
+    
+    return fundamentals
 
 
 def compute_indicators(data: pd.DataFrame) -> pd.DataFrame:
     """Append technical indicators to the provided dataframe."""
-    data = data.copy()
+    import numpy as np
+
+    import indicators
+
+    _pandas()
     try:
-        data.ta.rsi(close='close', length=14, append=True)
-        data.ta.macd(close='close', fast=12, slow=26, signal=9, append=True)
-        data.ta.sma(close='close', length=20, append=True)
-        data.ta.sma(close='close', length=50, append=True)
+        close = data['close'].to_numpy(dtype=np.float64)
+        rsi, sma_short, sma_long, macd, signal = indicators.compute_all(close)
+        data = data.assign(**{
+            RSI_COLUMN: rsi,
+            MACD_COLUMN: macd,
+            MACD_HIST_COLUMN: macd - signal,
+            MACD_SIGNAL_COLUMN: signal,
+            SMA20_COLUMN: sma_short,
+            SMA50_COLUMN: sma_long,
+        })
     except Exception as e:
         print(f"보조 지표 계산 중 오류 발생 (데이터 컬럼 확인 필요): {e}")
         pass 
     return data
 
 
-def format_float(value: float) -> str:
-    """Format a float value consistently for CLI output."""
-    return f"{value:.2f}"
+def latest_indicator_values(
+    ticker: str,
+    period: str,
+    interval: str,
+    data: pd.DataFrame,
+    *,
+    use_cache: bool = True,
+) -> np.ndarray:
+    """Return the latest close, RSI, SMA 20/50, MACD and signal values of ``data``.
+
+    시작일이 고정된 기간(``STATEFUL_PERIODS``: max, ytd)에서만 지표 상태를 디스크 캐시
+    옆에 저장합니다. 이전 실행의 상태가 ``data``에서 마지막 봉만 뺀 구간(첫 봉의 시각,
+    봉 개수, 직전 봉의 시각과 종가)과 정확히 같으면 새 봉 하나만 반영하고, 그 외에는
+    (첫 실행, 수정주가 반영, 여러 봉 추가 등) 전체 기간을 다시 계산하므로 결과는 항상
+    ``data``만으로 계산한 값과 같습니다. 1y처럼 길이가 고정된 기간은 창이 매일 이동해
+    상태를 다시 쓸 수 없으므로 저장하지 않고 매번 계산합니다.
+    """
+    import numpy as np
+
+    import indicators
+
+    close = data['close'].to_numpy(dtype=np.float64)
+    if period not in STATEFUL_PERIODS:
+        return indicators.compute_last(close)[0]
+
+    first_bar = data.index[0].isoformat() if close.size else None
+    key = _cache_key("state", ticker, period, interval)
+    saved = _load_from_disk(key) if use_cache else None
+
+    state = None
+    if saved is not None and close.size >= 2 and not math.isnan(close[-1]):
+        saved_first_bar, saved_size, saved_last_bar, saved_state = saved
+        if (
+            saved_first_bar == first_bar
+            and saved_size == close.size - 1
+            and saved_last_bar == data.index[-2].isoformat()
+            and saved_state.last_close == close[-2]
+        ):
+            state = saved_state
+            values = state.update(float(close[-1]))
+    if state is None:
+        values, state = indicators.compute_last(close)
+
+    if state is not None:
+        _store_on_disk(key, (first_bar, close.size, data.index[-1].isoformat(), state))
+    return values
+
+
+def latest_trading_day(data: pd.DataFrame) -> str:
+    """Return the date of the last row of ``data`` as ``YYYY-MM-DD``."""
+    # strftime보다 가벼운 ISO 문자열의 날짜 부분만 사용
+    return data.index[-1].isoformat()[:10]
+
+
+def export_data(data: pd.DataFrame, export_path: str) -> None:
+    """Write ``data`` to ``export_path``; the file format follows the suffix.
+
+    ``.parquet``/``.feather``는 열 단위 바이너리 형식이라 CSV보다 훨씬 빠르고 작습니다.
+    그 외의 확장자는 기존과 같이 CSV로 저장합니다.
+    """
+    suffix = Path(export_path).suffix.lower()
+    if suffix == ".parquet":
+        data.to_parquet(export_path)
+    elif suffix == ".feather":
+        # feather는 기본 RangeIndex만 지원하므로 날짜 인덱스를 컬럼으로 옮겨 저장
+        data.reset_index().to_feather(export_path)
+    else:
+        data.to_csv(export_path)
+
+
+# 지표 값의 상태 분류표: (경계값, 경계 포함 여부, 메시지) 행을 위에서부터 비교해
+# 처음으로 넘는(포함 여부가 참이면 같은 값도 포함하는) 행을 사용
+_RSI_STATES = (  # 30과 70은 중립
+    (70.0, False, "  -> 📈 상태: 과매수 구간 (과열)"),
+    (30.0, True, "  -> 📊 상태: 중립 구간"),
+    (-math.inf, True, "  -> 📉 상태: 과매도 구간 (침체)"),
+)
+_PER_STATES = (  # 0 이하(적자)만 마지막 행에 해당 (PER 0은 N/A로 처리됨)
+    (30.0, True, "  -> 📈 상태: 고평가 또는 성장주"),
+    (15.0, True, "  -> 📊 상태: (일반적) 적정 수준"),
+    (0.0, False, "  -> 📊 상태: (전통적) 저평가 구간"),
+    (-math.inf, True, "  -> 📉 상태: 적자 기업 (수익 없음)"),
+)
+_PBR_STATES = (
+    (2.0, True, "  -> 📈 상태: 고평가 (자산 가치 대비 주가 높음)"),
+    (1.0, True, "  -> 📊 상태: 양호"),
+    (-math.inf, True, "  -> 📊 상태: 저평가 (자산 가치 대비 주가 낮음)"),
+)
+_ROE_STATES = (
+    (0.15, False, "  -> 📈 상태: 우수 (자본 효율성 매우 높음)"),  # 15% 초과
+    (0.05, False, "  -> 📊 상태: 양호 (수익 발생 중)"),  # 5% 초과
+    (-math.inf, True, "  -> 📉 상태: 비효율 또는 적자"),
+)
+# 두 선의 비교 결과(bool)로 바로 인덱싱하는 메시지: [False, True]
+_SMA_CROSS_MSGS = (
+    "  -> 📉 상태: 단기 데드 크로스 (하락 추세)",
+    "  -> 📈 상태: 단기 골든 크로스 (상승 추세)",
+)
+_MACD_CROSS_MSGS = (
+    "  -> 📉 상태: 매도 신호 (하락 모멘텀)",
+    "  -> 📈 상태: 매수 신호 (상승 모멘텀)",
+)
+
+
+def _classify(value: float, table: tuple[tuple[float, bool, str], ...]) -> str:
+    """Return the message of the first row whose threshold ``value`` exceeds.
+
+    경계 포함 여부가 참인 행은 경계값과 같은 값도 그 행으로 분류합니다 (``>=``).
+    """
+    for threshold, inclusive, message in table:
+        if value > threshold or (inclusive and value == threshold):
+            return message
+    return table[-1][2]
+
+
+def _as_float(value: Any) -> float:
+    """Convert a fundamentals value to ``float``; missing or non-numeric values become NaN.
+
+    yfinance는 가끔 ``'Infinity'`` 같은 문자열이나 ``None``을 돌려주므로,
+    NaN 검사 전에 먼저 숫자로 바꿉니다.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def format_report(
+    ticker: str,
+    latest_date_str: str,
+    values: np.ndarray,
+    fundamentals: dict[str, Any],
+    fundamentals_error: Optional[str] = None,
+) -> str:
+    """Render the analysis report as a single string.
+
+    ``values``는 :func:`latest_indicator_values`가 돌려준 최근 거래일 값(종가, RSI,
+    20/50일선, MACD, 시그널)이며, 출력은 호출자가 한 번에 합니다.
+    ``fundamentals_error``가 있으면 기본적 분석 부분에 경고로 함께 출력합니다.
+    """
+    # --- [기술적 분석 결과 출력] ---
+    # 파이썬 float로 한 번에 꺼낸 뒤 유효성(NaN 여부)을 확인
+    metrics = values.tolist()
+    valid = [not math.isnan(value) for value in metrics]
+    lines: list[str] = []
+    close_px, rsi_14, sma_20, sma_50, macd_line, signal_line = metrics
+    close_ok, rsi_ok, sma20_ok, sma50_ok, macd_ok, signal_ok = valid
+
+    lines.append("---" * 15)
+    lines.append(
+        f"📊 {ticker} 기술적 분석 결과 (최근 거래일: "
+        f"{latest_date_str})"
+    )
+    lines.append("---" * 15)
+
+    if close_ok:
+        lines.append(f"종가 (수정 종가 기준): ${close_px:.2f}")
+    else:
+        lines.append("종가: (데이터 없음)")
+
+    lines.append("\n--- 📈 기술적 지표 ---")
+
+    # RSI 분석
+    if rsi_ok:
+        lines.append(f"RSI (14일): {rsi_14:.2f}")
+        lines.append(_classify(rsi_14, _RSI_STATES))
+    else:
+        lines.append("RSI (14일): 계산되지 않았습니다.")
+
+    # SMA 분석
+    lines.append("\n이동평균선 (SMA):")
+    if sma20_ok:
+        lines.append(f"  - 20일선: ${sma_20:.2f}")
+    else:
+        lines.append("  - 20일선: 계산되지 않았습니다.")
+    if sma50_ok:
+        lines.append(f"  - 50일선: ${sma_50:.2f}")
+    else:
+        lines.append("  - 50일선: 계산되지 않았습니다.")
+        
+    if sma20_ok and sma50_ok:
+        lines.append(_SMA_CROSS_MSGS[sma_20 > sma_50])
+
+    # MACD 분석
+    lines.append("\nMACD (12, 26, 9):")
+    if macd_ok:
+        lines.append(f"  - MACD 선: {macd_line:.2f}")
+    else:
+        lines.append("  - MACD 선: 계산되지 않았습니다.")
+    if signal_ok:
+        lines.append(f"  - 시그널 선: {signal_line:.2f}")
+    else:
+        lines.append("  - 시그널 선: 계산되지 않았습니다.")
+        
+    if macd_ok and signal_ok:
+        lines.append(_MACD_CROSS_MSGS[macd_line > signal_line])
+    
+    # --- [기본적 분석 결과 출력] ---
+    
+    if fundamentals_error is not None:
+        lines.append(f"\n[경고] 기본적 분석 데이터 가져오기 실패: {fundamentals_error}")
+    if not fundamentals:
+        lines.append("  (기본적 분석 데이터를 가져오는 데 실패했습니다.)")
+    else:
+        # PER 평가
+        per = _as_float(fundamentals.get('per'))
+        if per and not math.isnan(per):
+            lines.append(f"\nPER (주가수익비율): {per:.2f}")
+            lines.append(_classify(per, _PER_STATES))
+        else:
+            lines.append("\nPER: N/A (데이터 없음)")
+
+        # PBR 평가
+        pbr = _as_float(fundamentals.get('pbr'))
+        if pbr and not math.isnan(pbr):
+            lines.append(f"\nPBR (주가순자산비율): {pbr:.2f}")
+            lines.append(_classify(pbr, _PBR_STATES))
+        else:
+            lines.append("\nPBR: N/A (데이터 없음)")
+        
+        # ROE 평가 (yfinance와 pykrx(계산값) 모두 '비율'로 통일됨)
+        roe = _as_float(fundamentals.get('roe'))
+        if roe and not math.isnan(roe):
+            lines.append(f"\nROE (자기자본이익률): {roe * 100:.2f}%")
+            lines.append(_classify(roe, _ROE_STATES))
+        else:
+            lines.append("\nROE: N/A (데이터 없음)")
+    # --- [기본적 분석 끝] ---
+    
+
+    # --- [매매 신호 로직] ---
+
+    all_metrics_valid = all(valid[1:])
+
+    if all_metrics_valid:
+        is_sma_bullish = sma_20 > sma_50
+        is_macd_bullish = macd_line > signal_line
+        is_not_overbought = rsi_14 < 70
+        is_not_oversold = rsi_14 > 30
+
+        if is_sma_bullish and is_macd_bullish and is_not_overbought:
+            lines.append("\n💡 신호: 긍정적 (강력 매수 고려)")
+            lines.append("   (이유: 추세 상승 + 모멘텀 상승 + 과매수 아님)")
+
+        elif (not is_sma_bullish) and (not is_macd_bullish) and is_not_oversold:
+            lines.append("\n💡 신호: 부정적 (매도 또는 관망 고려)")
+            lines.append("   (이유: 추세 하락 + 모멘텀 하락 + 과매도 아님)")
+            
+        else:
+            lines.append("\n💡 신호: 🚦 중립 (신호 엇갈림)")
+            lines.append("   (이유: 지표들이 서로 다른 방향을 가리키고 있습니다.)")
+
+    else:
+        lines.append("\n💡 신호: (데이터 부족으로 신호를 생성할 수 없습니다.)")
+
+    return "\n".join(lines) + "\n"
 
 
 def analyze_stock(
@@ -126,6 +659,7 @@ def analyze_stock(
     period: str = "1y",
     interval: str = "1d",
     export_path: Optional[str] = None,
+    use_cache: bool = True,
 ) -> bool:
     """Perform technical analysis for the given ticker.
     Returns ``True`` if the analysis succeeded; otherwise ``False``.
@@ -133,7 +667,7 @@ def analyze_stock(
     
     # --- [데이터 수집 1: 기술적 분석] ---
     try:
-        data = download_stock_data(ticker, period, interval)
+        data = download_stock_data(ticker, period, interval, use_cache=use_cache)
     except ValueError as error:
         print(f"오류: {error}")
         return False
@@ -141,174 +675,69 @@ def analyze_stock(
         print(f"데이터 다운로드 중 예상치 못한 오류 발생: {error}")
         return False
 
-    try:
-        enriched_data = compute_indicators(data)
-    except Exception as error: 
-        print(f"보조 지표 계산 중 오류 발생: {error}")
-        return False
+    return analyze_stock_from_df(
+        ticker,
+        data,
+        period=period,
+        interval=interval,
+        export_path=export_path,
+        use_cache=use_cache,
+    )
 
-    try:
-        # --- [기술적 분석 결과 출력] ---
-        latest_data = enriched_data.iloc[-1]
-        
-        # [!!! 수정 !!!] 기본적 분석을 위해 최근 거래일 추출
-        latest_date_str = latest_data.name.strftime('%Y-%m-%d')
 
-        print("---" * 15)
-        print(
-            f"📊 {ticker} 기술적 분석 결과 (최근 거래일: "
-            f"{latest_date_str})"
+def analyze_stock_from_df(
+    ticker: str,
+    data: pd.DataFrame,
+    *,
+    period: str = "1y",
+    interval: str = "1d",
+    export_path: Optional[str] = None,
+    use_cache: bool = True,
+) -> bool:
+    """Analyze already downloaded price ``data`` (with a ``close`` column) for ``ticker``.
+    여러 종목을 한 번에 내려받은 경우처럼 다운로드와 분석을 분리할 때 사용합니다.
+    Returns ``True`` if the analysis succeeded; otherwise ``False``.
+    """
+    # 기본적 분석은 최근 거래일만 있으면 되므로, 보조 지표 계산과 동시에
+    # 네트워크 요청을 보내 대기 시간을 숨긴다.
+    latest_date_str = latest_trading_day(data)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fundamentals_future = executor.submit(
+            get_fundamental_data, ticker, latest_date_str, use_cache=use_cache
         )
-        print("---" * 15)
 
-        if 'close' in latest_data and pd.notna(latest_data['close']):
-             print(f"종가 (수정 종가 기준): ${format_float(latest_data['close'])}")
-        else:
-            print("종가: (데이터 없음)")
-
-        print("\n--- 📈 기술적 지표 ---")
-
-        # RSI 분석
-        rsi_14 = latest_data.get(RSI_COLUMN)
-        if pd.notna(rsi_14):
-            print(f"RSI (14일): {format_float(rsi_14)}")
-            if rsi_14 > 70:
-                print("  -> 📈 상태: 과매수 구간 (과열)")
-            elif rsi_14 < 30:
-                print("  -> 📉 상태: 과매도 구간 (침체)")
-            else:
-                print("  -> 📊 상태: 중립 구간")
-        else:
-            print("RSI (14일): 계산되지 않았습니다.")
-
-        # SMA 분석
-        sma_20 = latest_data.get(SMA20_COLUMN)
-        sma_50 = latest_data.get(SMA50_COLUMN)
-        print("\n이동평균선 (SMA):")
-        if pd.notna(sma_20):
-            print(f"  - 20일선: ${format_float(sma_20)}")
-        else:
-            print("  - 20일선: 계산되지 않았습니다.")
-        if pd.notna(sma_50):
-            print(f"  - 50일선: ${format_float(sma_50)}")
-        else:
-            print("  - 50일선: 계산되지 않았습니다.")
-            
-        if pd.notna(sma_20) and pd.notna(sma_50):
-            if sma_20 > sma_50:
-                print("  -> 📈 상태: 단기 골든 크로스 (상승 추세)")
-            else:
-                print("  -> 📉 상태: 단기 데드 크로스 (하락 추세)")
-
-        # MACD 분석
-        macd_line = latest_data.get(MACD_COLUMN)
-        signal_line = latest_data.get(MACD_SIGNAL_COLUMN)
-        print("\nMACD (12, 26, 9):")
-        if pd.notna(macd_line):
-            print(f"  - MACD 선: {format_float(macd_line)}")
-        else:
-            print("  - MACD 선: 계산되지 않았습니다.")
-        if pd.notna(signal_line):
-            print(f"  - 시그널 선: {format_float(signal_line)}")
-        else:
-            print("  - 시그널 선: 계산되지 않았습니다.")
-            
-        if pd.notna(macd_line) and pd.notna(signal_line):
-            if macd_line > signal_line:
-                print("  -> 📈 상태: 매수 신호 (상승 모멘텀)")
-            else:
-                print("  -> 📉 상태: 매도 신호 (하락 모멘텀)")
-        
-        # --- [데이터 수집 2: 기본적 분석] ---
-        # [!!! 수정 !!!] 기술적 분석이 끝난 후, 최근 거래일을 인자로 넘겨 호출
-        fundamentals = get_fundamental_data(ticker, latest_date_str)
-
-        # --- [기본적 분석 결과 출력] ---
-        
-        if not fundamentals:
-            print("  (기본적 분석 데이터를 가져오는 데 실패했습니다.)")
-        else:
-            # PER 평가
-            per = fundamentals.get('per')
-            if per and pd.notna(per):
-                print(f"\nPER (주가수익비율): {format_float(per)}")
-                if per > 0 and per < 15:
-                    print("  -> 📊 상태: (전통적) 저평가 구간")
-                elif per > 0 and per < 30:
-                    print("  -> 📊 상태: (일반적) 적정 수준")
-                elif per > 0:
-                    print("  -> 📈 상태: 고평가 또는 성장주")
-                else:
-                    print("  -> 📉 상태: 적자 기업 (수익 없음)")
-            else:
-                print("\nPER: N/A (데이터 없음)")
-
-            # PBR 평가
-            pbr = fundamentals.get('pbr')
-            if pbr and pd.notna(pbr):
-                print(f"\nPBR (주가순자산비율): {format_float(pbr)}")
-                if pbr < 1:
-                    print("  -> 📊 상태: 저평가 (자산 가치 대비 주가 낮음)")
-                elif pbr < 2:
-                    print("  -> 📊 상태: 양호")
-                else:
-                    print("  -> 📈 상태: 고평가 (자산 가치 대비 주가 높음)")
-            else:
-                print("\nPBR: N/A (데이터 없음)")
-            
-            # ROE 평가 (yfinance와 pykrx(계산값) 모두 '비율'로 통일됨)
-            roe = fundamentals.get('roe')
-            if roe and pd.notna(roe):
-                print(f"\nROE (자기자본이익률): {roe * 100:.2f}%")
-                if roe > 0.15: # 15% 이상
-                    print("  -> 📈 상태: 우수 (자본 효율성 매우 높음)")
-                elif roe > 0.05: # 5% 이상
-                    print("  -> 📊 상태: 양호 (수익 발생 중)")
-                else:
-                    print("  -> 📉 상태: 비효율 또는 적자")
-            else:
-                print("\nROE: N/A (데이터 없음)")
-        # --- [기본적 분석 끝] ---
-        
+        # 출력에는 마지막 값만 필요하므로 전체 지표 컬럼은 내보내기 시에만 계산
+        try:
+            values = latest_indicator_values(
+                ticker, period, interval, data, use_cache=use_cache
+            )
+        except Exception as error: 
+            print(f"보조 지표 계산 중 오류 발생: {error}")
+            return False
 
-        # --- [매매 신호 로직] ---
+        fundamentals_error = None
+        try:
+            fundamentals = fundamentals_future.result()
+        except Exception as error:
+            # 경고는 다른 종목의 출력과 섞이지 않도록 이 종목의 보고서 안에 넣음
+            fundamentals = {}
+            fundamentals_error = str(error)
 
-        all_metrics_valid = (
-            pd.notna(sma_20) and pd.notna(sma_50) and
-            pd.notna(macd_line) and pd.notna(signal_line) and pd.notna(rsi_14)
+    try:
+        # 보고서는 한 번에 만들어 한 번만 출력
+        sys.stdout.write(
+            format_report(ticker, latest_date_str, values, fundamentals, fundamentals_error)
         )
-
-        if all_metrics_valid:
-            is_sma_bullish = sma_20 > sma_50
-            is_macd_bullish = macd_line > signal_line
-            is_not_overbought = rsi_14 < 70
-            is_not_oversold = rsi_14 > 30
-
-            if is_sma_bullish and is_macd_bullish and is_not_overbought:
-                print("\n💡 신호: 긍정적 (강력 매수 고려)")
-                print("   (이유: 추세 상승 + 모멘텀 상승 + 과매수 아님)")
-
-            elif (not is_sma_bullish) and (not is_macd_bullish) and is_not_oversold:
-                print("\n💡 신호: 부정적 (매도 또는 관망 고려)")
-                print("   (이유: 추세 하락 + 모멘텀 하락 + 과매도 아님)")
-                
-            else:
-                print("\n💡 신호: 🚦 중립 (신호 엇갈림)")
-                print("   (이유: 지표들이 서로 다른 방향을 가리키고 있습니다.)")
-
-        else:
-            print("\n💡 신호: (데이터 부족으로 신호를 생성할 수 없습니다.)")
-
     except Exception as error:
         print(f"분석 중 오류 발생: {error}")
         return False
 
     if export_path:
         try:
-            enriched_data.to_csv(export_path)
+            export_data(compute_indicators(data), export_path)
             print(f"\n데이터가 '{export_path}' 파일로 저장되었습니다.")
         except Exception as error: 
-            print(f"CSV 저장 중 오류 발생: {error}")
+            print(f"파일 저장 중 오류 발생: {error}")
 
     return True
 
@@ -321,11 +750,19 @@ def build_argument_parser() -> argparse.ArgumentParser:
             "Yahoo Finance와 pykrx 데이터를 이용해 주식의 기술적/기본적 지표를 계산하고 출력합니다."
         )
     )
-    parser.add_argument("ticker", help="분석할 주식 코드 (예: AAPL, 005930.KS)")
+    parser.add_argument(
+        "tickers",
+        nargs="+",
+        metavar="ticker",
+        help="분석할 주식 코드, 여러 개 지정 가능 (예: AAPL, 005930.KS)",
+    )
     parser.add_argument(
         "--period",
         default="1y",
-        help="데이터 기간 (예: 1mo, 6mo, 1y, 5y). 기본값은 1y 입니다.",
+        help=(
+            "데이터 기간 (예: 1mo, 6mo, 1y, 5y, ytd, max). 기본값은 1y 입니다. "
+            "시작일이 고정된 ytd/max는 지표 상태를 저장해 새 봉만 이어서 계산합니다."
+        ),
     )
     parser.add_argument(
         "--interval",
@@ -334,7 +771,15 @@ def build_argument_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--export",
-        help="보조 지표가 포함된 전체 데이터를 CSV 파일로 저장합니다.",
+        help=(
+            "보조 지표가 포함된 전체 데이터를 파일로 저장합니다. "
+            "확장자가 .parquet 또는 .feather 이면 해당 형식, 그 외에는 CSV로 저장합니다."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"캐시({CACHE_DIR})를 무시하고 데이터를 새로 내려받습니다.",
     )
     return parser
 
@@ -345,10 +790,62 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser = build_argument_parser()
     args = parser.parse_args(argv)
 
-    success = analyze_stock(
-        args.ticker.upper(), period=args.period, interval=args.interval, export_path=args.export
-    )
-    return 0 if (success) else 1
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in args.tickers))
+    use_cache = not args.no_cache
+    _prune_disk_cache()
+    if len(tickers) == 1:
+        success = analyze_stock(
+            tickers[0],
+            period=args.period,
+            interval=args.interval,
+            export_path=args.export,
+            use_cache=use_cache,
+        )
+        return 0 if (success) else 1
+
+    # 여러 종목: 가격 데이터는 한 번의 요청으로, 기본적 분석 데이터는 병렬로 미리 받아둔다.
+    # (성공한 get_fundamental_data 결과는 캐시되므로 다시 요청하지 않고, 실패한 종목은
+    #  보고서를 만들 때 다시 시도해 경고를 그 종목의 보고서 안에 출력함)
+    try:
+        frames = download_stock_data_batch(
+            tickers, args.period, args.interval, use_cache=use_cache
+        )
+    except Exception as error:
+        print(f"데이터 일괄 다운로드 중 오류 발생 (종목별로 다시 시도합니다): {error}")
+        frames = {}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(frames) or 1)) as executor:
+        for ticker, data in frames.items():
+            executor.submit(
+                get_fundamental_data, ticker, latest_trading_day(data), use_cache=use_cache
+            )
+
+    results = []
+    for ticker in tickers:
+        export_path = None
+        if args.export:
+            path = Path(args.export)
+            export_path = str(path.with_name(f"{path.stem}_{ticker}{path.suffix}"))
+        if ticker in frames:
+            success = analyze_stock_from_df(
+                ticker,
+                frames[ticker],
+                period=args.period,
+                interval=args.interval,
+                export_path=export_path,
+                use_cache=use_cache,
+            )
+        else:
+            # 일괄 다운로드에서 빠진 종목은 개별 다운로드로 다시 시도 (오류 메시지 포함)
+            success = analyze_stock(
+                ticker,
+                period=args.period,
+                interval=args.interval,
+                export_path=export_path,
+                use_cache=use_cache,
+            )
+        results.append(success)
+    return 0 if all(results) else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""Ahead-of-time compile the indicator kernels into the ``analyze_kernels`` module.
+
+설치 시 한 번 ``python build_kernels.py``를 실행하면 이 파일과 같은 폴더에
+확장 모듈이 만들어지고, ``indicators.py``는 실행할 때마다 JIT 컴파일하는 대신
+이 모듈의 커널을 사용합니다. 빌드에는 numba가 필요하지만 실행에는 필요 없습니다.
+모듈에 함께 들어가는 ``kernel_abi()``(커널 소스의 해시)가 ``indicators.KERNEL_ABI``와
+다르면(커널을 고친 뒤 다시 빌드하지 않은 경우) ``indicators.py``는 JIT 커널을 사용합니다.
+"""
+import sys
+from pathlib import Path
+
+from numba.pycc import CC
+
+# 이미 빌드된 모듈이 있어도 JIT 버전(njit) 커널을 기준으로 다시 컴파일하도록 막아 둠
+sys.modules["analyze_kernels"] = None  # type: ignore[assignment]
+import indicators  # noqa: E402
+
+cc = CC("analyze_kernels")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+cc.export(
+    "indicators_kernel",
+    "void(f8[:], i8, f8[:], f8[:], f8[:], f8[:], f8[:])",
+)(indicators._indicators_kernel.py_func)
+cc.export("rsi_averages_last", "UniTuple(f8, 2)(f8[:])")(
+    indicators._rsi_averages_last.py_func
+)
+cc.export("macd_last", "UniTuple(f8, 4)(f8[:], i8)")(indicators._macd_last.py_func)
+
+if indicators.KERNEL_ABI is None:
+    raise SystemExit("indicators.py의 커널 소스를 읽을 수 없어 kernel_abi를 만들 수 없습니다.")
+KERNEL_ABI = indicators.KERNEL_ABI
+
+
+def _kernel_abi() -> int:
+    return KERNEL_ABI  # 컴파일 시점의 값(커널 소스 해시)으로 고정됨
+
+
+cc.export("kernel_abi", "i8()")(_kernel_abi)
+
+
+if __name__ == "__main__":
+    cc.compile()
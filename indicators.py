@@ -0,0 +1,350 @@
+"""NumPy/Numba kernels for the technical indicators reported by ``analyze.py``.
+
+``analyze.py``는 CLI 시작 시간을 줄이기 위해 이 모듈(그리고 numpy/numba)을
+지표를 실제로 계산할 때만 임포트합니다.
+
+커널은 NaN이 섞인 종가를 받고 NaN을 "아직 계산되지 않음" 표시로 돌려주므로,
+NaN이 없다고 가정하고 연산 순서를 바꾸는 fastmath 없이 컴파일합니다.
+(그래야 보고서 값과 ``--export`` 값이 같게 유지됨)
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+# 보조 지표 기간. Numba는 전역 정수를 컴파일 시점 상수로 고정하므로
+# 아래 커널들은 기간을 인자로 받지 않고 이 값들로 특수화되어 컴파일됨
+RSI_LENGTH = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+SMA_SHORT = 20
+SMA_LONG = 50
+
+
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    """Convert Wilder's average gain/loss into RSI.
+
+    하락폭 평균이 0이면(보합 포함) 0으로 나누는 대신 100을 돌려줍니다.
+    """
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+def _indicators_kernel(
+    close: np.ndarray,
+    start: int,
+    rsi_out: np.ndarray,
+    sma_short_out: np.ndarray,
+    sma_long_out: np.ndarray,
+    macd_out: np.ndarray,
+    signal_out: np.ndarray,
+) -> None:
+    """Fill every indicator array in a single pass over ``close``.
+
+    - SMA: 창 안의 합계를 더하고 빼며 갱신하고, NaN이 포함된 창은 NaN으로 둡니다.
+    - RSI: Wilder 평활, NaN 변동폭은 0으로 취급하며 하락폭 평균이 0이면 100입니다.
+    - MACD: ``close[start:]``(첫 유효 값)부터 EMA를 첫 기간의 단순 평균으로 시작합니다.
+    값이 정의되기 전의 원소는 호출자가 채워 둔 NaN을 그대로 둡니다.
+    """
+    alpha_fast = 2.0 / (MACD_FAST + 1)
+    alpha_slow = 2.0 / (MACD_SLOW + 1)
+    alpha_signal = 2.0 / (MACD_SIGNAL + 1)
+
+    sum_short = 0.0
+    sum_long = 0.0
+    nan_short = 0
+    nan_long = 0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    sig = 0.0
+
+    for i in range(close.size):
+        price = close[i]
+
+        # --- SMA (창 합계를 더하고 빼며 갱신)
+        if np.isnan(price):
+            nan_short += 1
+            nan_long += 1
+        else:
+            sum_short += price
+            sum_long += price
+        if i >= SMA_SHORT:
+            old = close[i - SMA_SHORT]
+            if np.isnan(old):
+                nan_short -= 1
+            else:
+                sum_short -= old
+        if i >= SMA_LONG:
+            old = close[i - SMA_LONG]
+            if np.isnan(old):
+                nan_long -= 1
+            else:
+                sum_long -= old
+        if i >= SMA_SHORT - 1 and nan_short == 0:
+            sma_short_out[i] = sum_short / SMA_SHORT
+        if i >= SMA_LONG - 1 and nan_long == 0:
+            sma_long_out[i] = sum_long / SMA_LONG
+
+        # --- RSI (Wilder)
+        if i >= 1:
+            delta = price - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i <= RSI_LENGTH:
+                avg_gain += gain / RSI_LENGTH
+                avg_loss += loss / RSI_LENGTH
+            else:
+                avg_gain = (avg_gain * (RSI_LENGTH - 1) + gain) / RSI_LENGTH
+                avg_loss = (avg_loss * (RSI_LENGTH - 1) + loss) / RSI_LENGTH
+            if i >= RSI_LENGTH:
+                rsi_out[i] = _rsi_value(avg_gain, avg_loss)
+
+        # --- MACD
+        j = i - start
+        if j < 0:
+            continue
+        if j < MACD_FAST:
+            ema_fast += price / MACD_FAST
+        else:
+            ema_fast = alpha_fast * price + (1.0 - alpha_fast) * ema_fast
+        if j < MACD_SLOW:
+            ema_slow += price / MACD_SLOW
+        else:
+            ema_slow = alpha_slow * price + (1.0 - alpha_slow) * ema_slow
+        if j < MACD_SLOW - 1:
+            continue
+
+        macd = ema_fast - ema_slow
+        macd_out[i] = macd
+        k = j - (MACD_SLOW - 1)
+        if k < MACD_SIGNAL:
+            sig += macd / MACD_SIGNAL
+            if k == MACD_SIGNAL - 1:
+                signal_out[i] = sig
+        else:
+            sig = alpha_signal * macd + (1.0 - alpha_signal) * sig
+            signal_out[i] = sig
+
+
+def compute_all(close: np.ndarray) -> np.ndarray:
+    """Compute every indicator over the whole ``close`` array.
+
+    반환값은 (5, N) 배열이며 행 순서는 RSI, 단기 SMA, 장기 SMA, MACD, 시그널입니다.
+    """
+    result = np.full((5, close.size), np.nan)
+    valid = np.flatnonzero(~np.isnan(close))
+    start = int(valid[0]) if valid.size else close.size
+    _indicators_kernel(close, start, *result)
+    return result
+
+
+def _rsi_averages_last(close: np.ndarray) -> tuple[float, float]:
+    """Return Wilder's average gain/loss at the last sample without allocating.
+
+    NaN 변동폭은 상승/하락 어느 쪽에도 더하지 않습니다(배열 버전과 동일).
+    """
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, RSI_LENGTH + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        elif delta < 0:
+            avg_loss -= delta
+    avg_gain /= RSI_LENGTH
+    avg_loss /= RSI_LENGTH
+    for i in range(RSI_LENGTH + 1, close.size):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (RSI_LENGTH - 1) + gain) / RSI_LENGTH
+        avg_loss = (avg_loss * (RSI_LENGTH - 1) + loss) / RSI_LENGTH
+    return avg_gain, avg_loss
+
+
+def _macd_last(close: np.ndarray, start: int) -> tuple[float, float, float, float]:
+    """Return the last MACD, signal and fast/slow EMA values using scalar state only.
+
+    ``close[start:]``에 최소 ``MACD_SLOW``개의 값이 있어야 하며, 시그널 선이 아직
+    계산되지 않는 구간이면 시그널 값으로 NaN을 돌려줍니다.
+    """
+    alpha_fast = 2.0 / (MACD_FAST + 1)
+    alpha_slow = 2.0 / (MACD_SLOW + 1)
+    alpha_signal = 2.0 / (MACD_SIGNAL + 1)
+
+    ema_fast = close[start:start + MACD_FAST].mean()
+    for i in range(start + MACD_FAST, start + MACD_SLOW):
+        ema_fast = alpha_fast * close[i] + (1.0 - alpha_fast) * ema_fast
+    ema_slow = close[start:start + MACD_SLOW].mean()
+
+    macd = ema_fast - ema_slow
+    macd_sum = macd
+    count = 1
+    sig = np.nan
+    for i in range(start + MACD_SLOW, close.size):
+        ema_fast = alpha_fast * close[i] + (1.0 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * close[i] + (1.0 - alpha_slow) * ema_slow
+        macd = ema_fast - ema_slow
+        if count < MACD_SIGNAL:
+            macd_sum += macd
+            count += 1
+            if count == MACD_SIGNAL:
+                sig = macd_sum / MACD_SIGNAL
+        else:
+            sig = alpha_signal * macd + (1.0 - alpha_signal) * sig
+    return macd, sig, ema_fast, ema_slow
+
+
+_KERNELS = (_rsi_value, _indicators_kernel, _rsi_averages_last, _macd_last)
+
+
+def _kernel_abi() -> Optional[int]:
+    """Hash the kernel sources and period constants into a positive 63-bit integer.
+
+    build_kernels.py가 이 값을 AOT 모듈의 ``kernel_abi()``로 함께 컴파일하므로,
+    커널을 고친 뒤 다시 빌드하지 않은 모듈은 값이 달라 사용되지 않습니다.
+    소스를 읽을 수 없으면 ``None``을 돌려줍니다.
+    """
+    try:
+        source = "".join(inspect.getsource(kernel) for kernel in _KERNELS)
+    except (OSError, TypeError):
+        return None
+    constants = (RSI_LENGTH, MACD_FAST, MACD_SLOW, MACD_SIGNAL, SMA_SHORT, SMA_LONG)
+    digest = hashlib.sha1(f"{source}{constants}".encode("utf-8")).hexdigest()
+    return int(digest[:15], 16)
+
+
+KERNEL_ABI = _kernel_abi()
+
+try:
+    # build_kernels.py로 미리 컴파일한(AOT) 커널이 있으면 JIT 컴파일과 numba 임포트를 건너뜀
+    import analyze_kernels as _aot
+except ImportError:
+    _aot = None
+else:
+    try:
+        _aot_abi = _aot.kernel_abi()
+    except Exception:  # kernel_abi가 없던 시절에 빌드된 모듈
+        _aot_abi = None
+    if KERNEL_ABI is None or _aot_abi != KERNEL_ABI:
+        _aot = None
+
+if _aot is not None:
+    _indicators_kernel = _aot.indicators_kernel
+    _rsi_averages_last = _aot.rsi_averages_last
+    _macd_last = _aot.macd_last
+else:
+    try:
+        from numba import njit
+    except ImportError:  # numba가 없으면 같은 루프를 파이썬으로 실행
+        pass
+    else:
+        # fastmath는 쓰지 않음 (모듈 설명 참고)
+        # 커널끼리의 호출(_rsi_value)은 컴파일 시점의 전역 값을 쓰므로 모두 바꾼 뒤 호출됨
+        _rsi_value = njit(cache=True)(_rsi_value)
+        _indicators_kernel = njit(cache=True)(_indicators_kernel)
+        _rsi_averages_last = njit(cache=True)(_rsi_averages_last)
+        _macd_last = njit(cache=True)(_macd_last)
+
+
+def compute_last(close: np.ndarray) -> tuple[np.ndarray, Optional[IndicatorState]]:
+    """Compute only the latest value of each indicator, plus its running state.
+
+    값의 순서는 종가, RSI, 단기 SMA, 장기 SMA, MACD, 시그널입니다.
+    전체 지표 배열을 만들지 않고 스칼라 상태만으로 마지막 값을 계산하므로,
+    내보내기(--export)가 없는 일반 실행에서는 이 함수만 사용합니다.
+    상태(:class:`IndicatorState`)는 모든 지표가 계산되고 최근 ``SMA_LONG``개 종가에
+    NaN이 없을 때만 돌려주며, 그렇지 않으면 ``None``입니다.
+    """
+    n = close.size
+    close_px = close[-1] if n else np.nan
+
+    rsi_14 = avg_gain = avg_loss = np.nan
+    if n > RSI_LENGTH:
+        avg_gain, avg_loss = _rsi_averages_last(close)
+        rsi_14 = _rsi_value(avg_gain, avg_loss)
+
+    sma_20 = close[-SMA_SHORT:].mean() if n >= SMA_SHORT else np.nan
+    sma_50 = close[-SMA_LONG:].mean() if n >= SMA_LONG else np.nan
+
+    macd_line = signal_line = ema_fast = ema_slow = np.nan
+    valid = np.flatnonzero(~np.isnan(close))
+    if valid.size and n - valid[0] >= MACD_SLOW:
+        macd_line, signal_line, ema_fast, ema_slow = _macd_last(close, int(valid[0]))
+
+    values = np.array([close_px, rsi_14, sma_20, sma_50, macd_line, signal_line])
+    if np.isnan(values).any():
+        return values, None
+    state = IndicatorState(
+        last_close=float(close_px),
+        avg_gain=float(avg_gain),
+        avg_loss=float(avg_loss),
+        ema_fast=float(ema_fast),
+        ema_slow=float(ema_slow),
+        ema_signal=float(signal_line),
+        closes=deque(close[-SMA_LONG:].tolist(), maxlen=SMA_LONG),
+    )
+    return values, state
+
+
+@dataclass
+class IndicatorState:
+    """Running indicator state that advances by one bar in O(1).
+
+    같은 종목을 반복 분석할 때 새 봉이 하나만 추가되었다면 전체 기간을 다시 계산하는
+    대신 :meth:`update`로 마지막 값만 갱신합니다. 상태는
+    :func:`compute_last`로 만듭니다.
+    """
+
+    last_close: float
+    avg_gain: float
+    avg_loss: float
+    ema_fast: float
+    ema_slow: float
+    ema_signal: float
+    closes: deque  # 최근 SMA_LONG개 종가 (SMA 창)
+
+    def update(self, close_px: float) -> np.ndarray:
+        """Advance the state by one closing price and return the latest values.
+
+        반환 순서는 :func:`compute_last`가 돌려주는 값과 같습니다.
+        """
+        delta = close_px - self.last_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        self.avg_gain = (self.avg_gain * (RSI_LENGTH - 1) + gain) / RSI_LENGTH
+        self.avg_loss = (self.avg_loss * (RSI_LENGTH - 1) + loss) / RSI_LENGTH
+        self.last_close = close_px
+
+        alpha_fast = 2.0 / (MACD_FAST + 1)
+        alpha_slow = 2.0 / (MACD_SLOW + 1)
+        alpha_signal = 2.0 / (MACD_SIGNAL + 1)
+        self.ema_fast = alpha_fast * close_px + (1.0 - alpha_fast) * self.ema_fast
+        self.ema_slow = alpha_slow * close_px + (1.0 - alpha_slow) * self.ema_slow
+        macd = self.ema_fast - self.ema_slow
+        self.ema_signal = alpha_signal * macd + (1.0 - alpha_signal) * self.ema_signal
+
+        # 창 합계를 누적 갱신하면 반복 호출마다 오차가 쌓이므로 50개를 매번 다시 더함
+        self.closes.append(close_px)
+        window = list(self.closes)
+        sma_short = math.fsum(window[-SMA_SHORT:]) / SMA_SHORT
+        sma_long = math.fsum(window) / SMA_LONG
+
+        return np.array([
+            close_px,
+            _rsi_value(self.avg_gain, self.avg_loss),
+            sma_short,
+            sma_long,
+            macd,
+            self.ema_signal,
+        ])
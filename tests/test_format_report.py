@@ -0,0 +1,39 @@
+"""Checks for ``analyze.format_report`` with unusual fundamentals values.
+
+    python -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyze  # noqa: E402
+
+
+class FormatReportTest(unittest.TestCase):
+    values = np.array([100.0, 55.0, 98.0, 95.0, 1.5, 1.2])
+
+    def test_non_numeric_fundamentals(self):
+        # yfinance가 숫자 대신 문자열을 돌려줘도 보고서 전체가 실패하면 안 됨
+        report = analyze.format_report(
+            "AAPL", "2025-11-10", self.values, {"per": "Infinity", "pbr": "N/A", "roe": None}
+        )
+        self.assertIn("RSI", report)
+        self.assertIn("PER (주가수익비율): inf", report)
+        self.assertIn("PBR: N/A (데이터 없음)", report)
+        self.assertIn("ROE: N/A (데이터 없음)", report)
+
+    def test_numeric_strings_are_used(self):
+        report = analyze.format_report(
+            "AAPL", "2025-11-10", self.values, {"per": "12.5", "pbr": 0.8, "roe": float("nan")}
+        )
+        self.assertIn("PER (주가수익비율): 12.50", report)
+        self.assertIn("PBR (주가순자산비율): 0.80", report)
+        self.assertIn("ROE: N/A (데이터 없음)", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Regression checks for the saved indicator state in ``analyze.latest_indicator_values``.
+
+저장된 상태를 이어서 쓰든 처음부터 다시 계산하든, 결과는 항상 주어진 구간만으로
+``indicators.compute_last``를 실행한 값과 같아야 합니다.
+
+    python -m unittest discover tests
+"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyze  # noqa: E402
+import indicators  # noqa: E402
+
+
+class LatestIndicatorValuesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(analyze, "CACHE_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+        rng = np.random.default_rng(1)
+        close = 100 + np.cumsum(rng.normal(size=1300))
+        index = pd.date_range("2020-01-01", periods=close.size, freq="D")
+        self.full = pd.DataFrame({"close": close}, index=index)
+
+    def assert_matches_fresh(self, values, data, *, exact=True):
+        expected = indicators.compute_last(data["close"].to_numpy(dtype=np.float64))[0]
+        if exact:
+            np.testing.assert_array_equal(values, expected)
+        else:
+            np.testing.assert_allclose(values, expected, rtol=1e-9, equal_nan=True)
+
+    def run_twice(self, first, second, *, first_period="max", second_period="max"):
+        analyze.latest_indicator_values("X", first_period, "1d", first)
+        with mock.patch.object(indicators, "compute_last", wraps=indicators.compute_last) as full_pass:
+            values = analyze.latest_indicator_values("X", second_period, "1d", second)
+        return values, full_pass.called
+
+    def test_one_new_bar_uses_saved_state(self):
+        data = self.full.iloc[:300]
+        values, recomputed = self.run_twice(data.iloc[:-1], data)
+        self.assertFalse(recomputed)
+        self.assert_matches_fresh(values, data, exact=False)
+
+    def test_rolling_period_keeps_no_state(self):
+        data = self.full.iloc[:300]
+        values, recomputed = self.run_twice(
+            data.iloc[:-1], data, first_period="1y", second_period="1y"
+        )
+        self.assertTrue(recomputed)
+        self.assert_matches_fresh(values, data)
+        self.assertEqual(list(analyze.CACHE_DIR.iterdir()), [])
+
+    def test_other_period_recomputes(self):
+        # max 실행 다음 날의 ytd 실행: 21개 봉으로는 SMA 50과 MACD를 계산할 수 없음
+        short = self.full.iloc[-21:]
+        values, recomputed = self.run_twice(
+            self.full.iloc[:-1], short, first_period="max", second_period="ytd"
+        )
+        self.assertTrue(recomputed)
+        self.assert_matches_fresh(values, short)
+
+    def test_sliding_window_recomputes(self):
+        values, recomputed = self.run_twice(self.full.iloc[-64:-1], self.full.iloc[-63:])
+        self.assertTrue(recomputed)
+        self.assert_matches_fresh(values, self.full.iloc[-63:])
+
+    def test_adjusted_history_recomputes(self):
+        data = self.full.iloc[:300]
+        adjusted = data * 0.98
+        values, recomputed = self.run_twice(data.iloc[:-1], adjusted)
+        self.assertTrue(recomputed)
+        self.assert_matches_fresh(values, adjusted)
+
+
+if __name__ == "__main__":
+    unittest.main()
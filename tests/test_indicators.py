@@ -0,0 +1,111 @@
+"""Check the NumPy/Numba indicator kernels against straightforward pandas references.
+
+기준 구현: SMA는 ``rolling().mean()``, MACD의 EMA는 첫 기간의 단순 평균으로 시작하는
+``ewm(adjust=False)``, RSI는 Wilder 평활(NaN 변동폭은 0)입니다.
+
+    python -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import indicators  # noqa: E402
+
+TOLERANCE = {"rtol": 1e-9, "atol": 1e-9, "equal_nan": True}
+
+
+def reference_sma(close, length):
+    return close.rolling(length).mean()
+
+
+def reference_ema(values, length):
+    """SMA-seeded EMA starting at the first valid value (pandas-ta style)."""
+    first = values.first_valid_index()
+    seeded = values.copy()
+    seeded.iloc[: first + length - 1] = np.nan
+    seeded.iloc[first + length - 1] = values.iloc[first : first + length].mean()
+    return seeded.ewm(span=length, adjust=False).mean()
+
+
+def reference_rsi(close, length):
+    delta = close.diff().fillna(0.0).to_numpy()
+    gain = np.clip(delta, 0.0, None)
+    loss = np.clip(-delta, 0.0, None)
+    rsi = np.full(close.size, np.nan)
+    avg_gain = gain[1 : length + 1].mean()
+    avg_loss = loss[1 : length + 1].mean()
+    for i in range(length, close.size):
+        if i > length:
+            avg_gain = (avg_gain * (length - 1) + gain[i]) / length
+            avg_loss = (avg_loss * (length - 1) + loss[i]) / length
+        rsi[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi
+
+
+class ComputeAllTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.close = 100 + np.cumsum(rng.normal(size=300))
+
+    def assert_matches_reference(self, close):
+        series = pd.Series(close)
+        rsi, sma_short, sma_long, macd, signal = indicators.compute_all(close)
+
+        expected_macd = reference_ema(series, indicators.MACD_FAST) - reference_ema(
+            series, indicators.MACD_SLOW
+        )
+        expected_signal = reference_ema(expected_macd, indicators.MACD_SIGNAL)
+
+        np.testing.assert_allclose(rsi, reference_rsi(series, indicators.RSI_LENGTH), **TOLERANCE)
+        np.testing.assert_allclose(
+            sma_short, reference_sma(series, indicators.SMA_SHORT), **TOLERANCE
+        )
+        np.testing.assert_allclose(
+            sma_long, reference_sma(series, indicators.SMA_LONG), **TOLERANCE
+        )
+        np.testing.assert_allclose(macd, expected_macd, **TOLERANCE)
+        np.testing.assert_allclose(signal, expected_signal, **TOLERANCE)
+
+    def assert_last_matches_all(self, close):
+        # 보고서(compute_last)와 --export(compute_all)가 같은 값을 보여야 함
+        last = indicators.compute_last(close)[0]
+        self.assertEqual(last[0], close[-1])
+        np.testing.assert_allclose(
+            last[1:], indicators.compute_all(close)[:, -1], rtol=1e-12, atol=1e-12, equal_nan=True
+        )
+
+    def test_random_walk(self):
+        self.assert_matches_reference(self.close)
+        self.assert_last_matches_all(self.close)
+
+    def test_leading_nan(self):
+        close = self.close.copy()
+        close[:5] = np.nan
+        self.assert_matches_reference(close)
+        self.assert_last_matches_all(close)
+
+    def test_flat_series(self):
+        close = np.full(120, 70000.0)
+        self.assert_matches_reference(close)
+        self.assert_last_matches_all(close)
+        rsi, sma_short, sma_long, macd, signal = indicators.compute_all(close)
+        self.assertEqual(rsi[-1], 100.0)
+        self.assertEqual(sma_long[-1], 70000.0)
+        self.assertEqual(macd[-1], 0.0)
+
+    def test_short_series(self):
+        for size in (0, 1, indicators.RSI_LENGTH, indicators.MACD_SLOW, indicators.SMA_LONG - 1):
+            close = self.close[:size]
+            if size:
+                self.assert_last_matches_all(close)
+            else:
+                self.assertTrue(np.isnan(indicators.compute_last(close)[0]).all())
+
+
+if __name__ == "__main__":
+    unittest.main()